@@ -28,11 +28,30 @@ Available models (Icen, 2025):
 """
 
 import os
+import pickle
 import pandas as pd
 import numpy as np
 
+import shapely
 from shapely.geometry import Point
-from shapely import wkt
+from shapely.prepared import prep
+
+# Optional: numexpr evaluates the amplification formula in one fused,
+# multi-threaded pass; without it plain NumPy is used.
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+# Prefer the Rust-backed calamine reader for .xlsx files when
+# python-calamine is installed and pandas supports it (engine="calamine"
+# exists from pandas 2.2); otherwise use pandas' openpyxl reader.
+try:
+    import python_calamine  # noqa: F401
+    _PANDAS_VERSION = tuple(int(v) for v in pd.__version__.split(".")[:2])
+    EXCEL_ENGINE = "calamine" if _PANDAS_VERSION >= (2, 2) else "openpyxl"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
 # ============================================================
 #  BASE DIRECTORY & FILE PATHS
@@ -46,11 +65,34 @@ except NameError:
 
 COEFF_FILE = os.path.join(BASE_DIR, "Coefficients", "Icen_coeffs.txt")
 COORDS_FILE = os.path.join(BASE_DIR, "Coefficients", "Coordinates", "Coordinates.xlsx")
-
-def load_coefficients_interpolated(model: str, periods):
+_REGIONS_CACHE = COORDS_FILE + ".pkl"
+
+# Column names used internally, in file order:
+#  0: Period
+#  1: c1
+#  2: Δc1,Marmara
+#  3: Δc1,Coastal Aegean
+#  4: Δc1,Aegean
+#  5: Δc1,East
+#  6: c2
+#  7: c3
+#  8: c4
+#  9: VC
+# 10: V1
+# 11: Sigma
+COEFF_COLUMNS = [
+    "Period", "c1",
+    "d_c1_Marmara", "d_c1_Coastal", "d_c1_Aegean", "d_c1_East",
+    "c2", "c3", "c4", "Vc", "V1", "sigma",
+]
+
+# Reference velocity of the linear term (m/s)
+VREF = 760.0
+
+
+def _load_coeff_table():
     """
-    Load Icen (2025) coefficients from Icen_coeffs.txt and interpolate
-    to requested periods.
+    Read Icen_coeffs.txt once and return (period_array, columns).
 
     The file columns (from your final version) are:
 
@@ -58,63 +100,78 @@ def load_coefficients_interpolated(model: str, periods):
         Δc1,Marmara, Δc1,Coastal Aegean, Δc1,Aegean, (Δc1,East),
         c2, c3, c4, VC, V1, Standard Deviation
 
-    We rename them to simpler names once and interpolate all numeric
-    columns except 'Period'.
+    The header is skipped and columns are renamed by position (see
+    COEFF_COLUMNS) so we don’t fight with Δ / commas etc. Rows are sorted
+    by period so the table can be used directly as np.interp knots.
+
+    Returns
+    -------
+    period : ndarray, shape (n_table,)
+    columns : dict of ndarray
+        Every column except 'Period', keyed by its COEFF_COLUMNS name.
     """
     if not os.path.isfile(COEFF_FILE):
         raise FileNotFoundError(f"Coefficient file not found:\n  {COEFF_FILE}")
 
-    df = pd.read_csv(COEFF_FILE, sep=r"\s+")
-    df = df.sort_values("Period")
-
-    # Rename columns by position so we don’t fight with Δ / commas etc.
-    cols = df.columns.tolist()
-    # Expected order from the file:
-    # 0: Period
-    # 1: c1
-    # 2: Δc1,Marmara
-    # 3: Δc1,Coastal Aegean
-    # 4: Δc1,Aegean
-    # 5: Δc1,East 
-    # 6: c2
-    # 7: c3
-    # 8: c4
-    # 9: VC
-    # 10: V1
-    # 11: Sigma
-    if len(cols) != 12:
+    table = np.loadtxt(COEFF_FILE, skiprows=1, ndmin=2, encoding="utf-8")
+
+    if table.shape[1] != len(COEFF_COLUMNS):
         raise ValueError(
-            f"Unexpected number of columns in Icen_coeffs.txt: {len(cols)} "
-            f"(expected 12). Got: {cols}"
+            f"Unexpected number of columns in Icen_coeffs.txt: {table.shape[1]} "
+            f"(expected {len(COEFF_COLUMNS)})."
         )
 
-    cols[2] = "d_c1_Marmara"
-    cols[3] = "d_c1_Coastal"
-    cols[4] = "d_c1_Aegean"
-    cols[5] = "d_c1_East"
-    cols[6] = "c2"
-    cols[7] = "c3"
-    cols[8] = "c4"
-    cols[9] = "Vc"
-    cols[10] = "V1"
-    cols[11] = "sigma"
-
-    df.columns = cols
-
-    result = []
-    for p in periods:
-        if p in df["Period"].values:
-            row = df[df["Period"] == p].iloc[0].to_dict()
-        else:
-            # Interpolate all numeric columns except 'Period'
-            row = {"Period": p}
-            for col in df.columns:
-                if col == "Period":
-                    continue
-                row[col] = np.interp(p, df["Period"], df[col])
-        result.append(row)
-
-    return result
+    table = table[np.argsort(table[:, 0], kind="stable")]
+
+    period = table[:, 0].copy()
+    columns = {
+        name: table[:, k].copy()
+        for k, name in enumerate(COEFF_COLUMNS)
+        if name != "Period"
+    }
+    return period, columns
+
+
+# Read the coefficient table once
+_COEFF_TABLE = _load_coeff_table()
+
+
+def load_coefficients_interpolated(model: str, periods):
+    """
+    Interpolate the Icen (2025) coefficients (cached from Icen_coeffs.txt
+    at import) to the requested periods.
+
+    There is no separate exact-match path: np.interp returns the tabulated
+    row bit-for-bit when a period equals a knot of the (sorted) table, and
+    linearly interpolates otherwise. Periods outside the table range take
+    the first/last tabulated values.
+
+    Returns
+    -------
+    coeffs : dict of ndarray
+        One array of shape (n_periods,) per column, keyed by the renamed
+        column names ('Period', 'c1', 'd_c1_Marmara', ..., 'sigma'), plus
+        the derived per-period terms
+
+            'c3_exp400'  : exp(c3 * 400)
+            'logV1_Vref' : ln(V1 / VREF)
+            'logVc_Vref' : ln(Vc / VREF)
+
+        which are computed from the interpolated c3, V1, Vc (not
+        interpolated themselves) so they stay exact between knots.
+    """
+    xp, columns = _COEFF_TABLE
+
+    # Interpolate every column over all requested periods in one call each
+    out = {"Period": np.asarray(periods, dtype=float)}
+    for col, fp in columns.items():
+        out[col] = np.interp(out["Period"], xp, fp)
+
+    out["c3_exp400"] = np.exp(out["c3"] * 400.0)
+    out["logV1_Vref"] = np.log(out["V1"] / VREF)
+    out["logVc_Vref"] = np.log(out["Vc"] / VREF)
+
+    return out
 
 
 # ============================================================
@@ -140,6 +197,27 @@ FID_TO_MODEL = {
 #  LOAD REGIONS (POLYGONS) FROM COORDINATES.XLSX
 # ============================================================
 
+def _make_region(fid_val: str, poly, bbox):
+    """
+    Build a region dict from its fid, polygon and bounding box, applying
+    the current FID_TO_REGION / FID_TO_MODEL mapping.
+    """
+    if fid_val not in FID_TO_REGION or fid_val not in FID_TO_MODEL:
+        raise ValueError(
+            f"fid='{fid_val}' not found in FID_TO_REGION/FID_TO_MODEL mapping. "
+            f"Update FID_TO_REGION / FID_TO_MODEL in this script."
+        )
+
+    return {
+        "fid": fid_val,
+        "region_name": FID_TO_REGION[fid_val],
+        "model": FID_TO_MODEL[fid_val],
+        "polygon": poly,
+        "prepared": prep(poly),
+        "bbox": bbox,
+    }
+
+
 def load_regions_from_excel(excel_path: str):
     """
     Read region polygons from Coordinates.xlsx.
@@ -151,13 +229,15 @@ def load_regions_from_excel(excel_path: str):
     Returns
     -------
     regions : list of dicts with keys:
-        'fid', 'region_name', 'model', 'polygon'
+        'fid', 'region_name', 'model', 'polygon', 'prepared', 'bbox'
+        ('prepared' is the polygon wrapped with shapely.prepared.prep for
+        fast repeated point tests, 'bbox' its (minx, miny, maxx, maxy))
     """
     if not os.path.isfile(excel_path):
         raise FileNotFoundError(f"Coordinates file not found:\n  {excel_path}")
 
     # Read first sheet (your file uses a simple single sheet)
-    df = pd.read_excel(excel_path, sheet_name=0)
+    df = pd.read_excel(excel_path, sheet_name=0, engine=EXCEL_ENGINE)
 
     # Normalize column names
     cols_lower = {c.lower(): c for c in df.columns}
@@ -171,32 +251,21 @@ def load_regions_from_excel(excel_path: str):
     wkt_col = cols_lower["wkt_geom"]
     fid_col = cols_lower["fid"]
 
-    regions = []
-    for _, row in df.iterrows():
-        fid_val = str(row[fid_col]).strip()
-        wkt_str = str(row[wkt_col])
+    # Plain NumPy columns (no per-row pd.Series)
+    fids = df[fid_col].astype(str).str.strip().to_numpy()
+    wkt_strs = df[wkt_col].fillna("").astype(str)
+    wkts = wkt_strs.to_numpy(dtype=object)
 
-        if not wkt_str.strip():
-            continue  # skip empty geometries
+    # Parse all WKT strings in one call; empty geometries become None
+    wkts[(wkt_strs.str.strip() == "").to_numpy()] = None
+    polys = shapely.from_wkt(wkts)
 
-        if fid_val not in FID_TO_REGION or fid_val not in FID_TO_MODEL:
-            raise ValueError(
-                f"fid='{fid_val}' not found in FID_TO_REGION/FID_TO_MODEL mapping. "
-                f"Update FID_TO_REGION / FID_TO_MODEL in this script."
-            )
+    regions = []
+    for fid_val, poly in zip(fids, polys):
+        if poly is None:
+            continue  # skip empty geometries
 
-        region_name = FID_TO_REGION[fid_val]
-        model_name = FID_TO_MODEL[fid_val]
-        poly = wkt.loads(wkt_str)
-
-        regions.append(
-            {
-                "fid": fid_val,
-                "region_name": region_name,
-                "model": model_name,
-                "polygon": poly,
-            }
-        )
+        regions.append(_make_region(fid_val, poly, poly.bounds))
 
     if not regions:
         raise ValueError("No valid regions found in Coordinates.xlsx.")
@@ -204,8 +273,159 @@ def load_regions_from_excel(excel_path: str):
     return regions
 
 
-# Load regions once
-REGIONS = load_regions_from_excel(COORDS_FILE)
+def load_regions_cached(excel_path: str, cache_path: str):
+    """
+    Same as load_regions_from_excel, but reuse a pickle of the parsed
+    regions at cache_path while it is at least as new as excel_path.
+
+    Only 'fid', 'polygon' and 'bbox' are pickled. 'region_name' and
+    'model' are re-applied from FID_TO_REGION / FID_TO_MODEL on load, so
+    edits to those mappings take effect without clearing the cache, and
+    prepared geometries (not picklable) are rebuilt. Failure to write the
+    cache (e.g. read-only folder) is ignored.
+    """
+    cached = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            cached = [(c["fid"], c["polygon"], c["bbox"]) for c in cached]
+    except Exception:
+        cached = None  # missing or unreadable cache -> rebuild from the xlsx
+
+    if cached is not None:
+        return [_make_region(*c) for c in cached]
+
+    regions = load_regions_from_excel(excel_path)
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(
+                [{k: r[k] for k in ("fid", "polygon", "bbox")}
+                 for r in regions],
+                f,
+            )
+    except OSError:
+        pass
+
+    return regions
+
+
+# Cell size (degrees) of the coarse lookup grid used by find_region_for_point
+GRID_CELL_DEG = 0.1
+
+# Grid cell codes other than a REGIONS index
+_GRID_OUTSIDE = -1   # cell touches no region
+_GRID_MIXED = -2     # cell crosses a boundary -> exact polygon test needed
+
+
+def _build_region_grid(regions, cell_size: float = GRID_CELL_DEG):
+    """
+    Rasterize the regions onto a lat/lon grid covering their bounding boxes.
+
+    Each cell holds the index of the only region that intersects it if that
+    region contains the whole cell, _GRID_OUTSIDE if no region intersects
+    it, and _GRID_MIXED otherwise. Cells are tested slightly enlarged so
+    that rounding in the point -> cell index computation cannot put a
+    point in a cell whose box does not contain it.
+
+    Returns
+    -------
+    (lon0, lat0, cell_size, grid) with grid of shape (n_lat, n_lon)
+    """
+    bounds = np.array([r["bbox"] for r in regions])
+    lon0, lat0 = bounds[:, 0].min(), bounds[:, 1].min()
+    n_lon = int(np.ceil((bounds[:, 2].max() - lon0) / cell_size))
+    n_lat = int(np.ceil((bounds[:, 3].max() - lat0) / cell_size))
+
+    j, i = np.meshgrid(np.arange(n_lon), np.arange(n_lat))
+    eps = 1e-9
+    boxes = shapely.box(
+        lon0 + j * cell_size - eps, lat0 + i * cell_size - eps,
+        lon0 + (j + 1) * cell_size + eps, lat0 + (i + 1) * cell_size + eps,
+    )
+
+    n_hits = np.zeros(boxes.shape, dtype=int)
+    grid = np.full(boxes.shape, _GRID_MIXED, dtype=np.intp)
+    inside = []
+    for region in regions:
+        poly = region["polygon"]
+        n_hits += shapely.intersects(poly, boxes)
+        inside.append(shapely.contains_properly(poly, boxes))
+
+    grid[n_hits == 0] = _GRID_OUTSIDE
+    for k, region_inside in enumerate(inside):
+        grid[(n_hits == 1) & region_inside] = k
+
+    return lon0, lat0, cell_size, grid
+
+
+# Regions and the lookup structures built from them are loaded lazily on
+# first use, so importing this module for the coefficient API alone does
+# not touch Coordinates.xlsx.
+_regions = None
+_region_grid = None
+_tree = None
+_pip_arrays = None
+_pip_numba_module = None     # the _pip_numba module once numba is found
+_pip_numba_checked = False
+
+# The numba kernel costs ~0.2 s per process to load (longer on the first
+# JIT compile) but is ~6x faster per point than the STRtree, so it only
+# pays off for large batches.
+_NUMBA_MIN_POINTS = 200_000
+
+
+def _get_regions():
+    """Load regions once (from the pickle cache when it is up to date)."""
+    global _regions
+    if _regions is None:
+        _regions = load_regions_cached(COORDS_FILE, _REGIONS_CACHE)
+    return _regions
+
+
+def _get_region_grid():
+    """Coarse grid answering most point lookups without a polygon test."""
+    global _region_grid
+    if _region_grid is None:
+        _region_grid = _build_region_grid(_get_regions())
+    return _region_grid
+
+
+def _get_tree():
+    """Spatial index over the region polygons (tree index == REGIONS index)."""
+    global _tree
+    if _tree is None:
+        _tree = shapely.STRtree([r["polygon"] for r in _get_regions()])
+    return _tree
+
+
+def _get_pip_numba():
+    """Import the numba kernel module on first use; None without numba."""
+    global _pip_numba_module, _pip_numba_checked
+    if not _pip_numba_checked:
+        import _pip_numba
+        if _pip_numba.NUMBA_AVAILABLE:
+            _pip_numba_module = _pip_numba
+        _pip_numba_checked = True
+    return _pip_numba_module
+
+
+def _get_pip_arrays():
+    """Flat (CSR) polygon arrays for the numba kernel."""
+    global _pip_arrays
+    if _pip_arrays is None:
+        _pip_arrays = _get_pip_numba().flatten_polygons(
+            [r["polygon"] for r in _get_regions()]
+        )
+    return _pip_arrays
+
+
+def __getattr__(name):
+    # Keep `Icen2026.REGIONS` working now that regions load lazily
+    if name == "REGIONS":
+        return _get_regions()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def find_region_for_point(lat: float, lon: float):
@@ -215,18 +435,84 @@ def find_region_for_point(lat: float, lon: float):
     Returns
     -------
     region_dict or None
-        region_dict keys: 'fid', 'region_name', 'model', 'polygon'.
+        region_dict keys: 'fid', 'region_name', 'model', 'polygon',
+        'prepared', 'bbox'.
         Returns None if the point is not inside any region.
     """
+    # Coarse grid first: cells fully inside one region or outside all
+    # regions answer directly (NaN coordinates fail the range test)
+    regions = _get_regions()
+    lon0, lat0, cell_size, grid = _get_region_grid()
+    fi = (lat - lat0) / cell_size
+    fj = (lon - lon0) / cell_size
+    if 0 <= fi < grid.shape[0] and 0 <= fj < grid.shape[1]:
+        k = grid[int(fi), int(fj)]
+        if k >= 0:
+            return regions[k]
+        if k == _GRID_OUTSIDE:
+            return None
+
     pt = Point(lon, lat)  # shapely uses (x, y) = (lon, lat)
-    for region in REGIONS:
-        poly = region["polygon"]
-        # include boundary as well
-        if poly.contains(pt) or poly.touches(pt):
+    for region in regions:
+        # cheap bounding-box rejection before the polygon test
+        minx, miny, maxx, maxy = region["bbox"]
+        if not (minx <= lon <= maxx and miny <= lat <= maxy):
+            continue
+
+        # covers = contains or on the boundary, in one predicate
+        if region["prepared"].covers(pt):
             return region
     return None
 
 
+def find_regions_for_points(lats, lons):
+    """
+    Batch version of find_region_for_point for many coordinates at once.
+
+    Batches of at least _NUMBA_MIN_POINTS points use the numba
+    crossing-number kernel in _pip_numba when numba is installed (points
+    it flags as lying on an edge are passed on to the STRtree); everything
+    else is a single STRtree query.
+
+    Returns
+    -------
+    idx : ndarray of int, shape (n_points,)
+        Index into REGIONS of the region containing each point (boundary
+        included), or -1 if the point is outside all regions or has NaN
+        coordinates. When a point lies on a shared boundary the first
+        region in REGIONS wins, as in find_region_for_point.
+    """
+    lats = np.asarray(lats, dtype=float).ravel()
+    lons = np.asarray(lons, dtype=float).ravel()
+    if lats.shape != lons.shape:
+        raise ValueError(
+            f"lats and lons must have the same length "
+            f"({lats.size} vs {lons.size})."
+        )
+
+    if lats.size >= _NUMBA_MIN_POINTS and _get_pip_numba() is not None:
+        kernel = _get_pip_numba()
+        idx = kernel.pip_batch(lons, lats, *_get_pip_arrays())
+        amb = idx == kernel.AMBIGUOUS
+        if amb.any():
+            idx[amb] = _query_tree(lats[amb], lons[amb])
+        return idx
+
+    return _query_tree(lats, lons)
+
+
+def _query_tree(lats, lons):
+    """STRtree path of find_regions_for_points (same return value)."""
+    pts = shapely.points(lons, lats)  # shapely uses (x, y) = (lon, lat)
+    pt_idx, reg_idx = _get_tree().query(pts, predicate="intersects")
+
+    n_regions = len(_get_regions())
+    idx = np.full(lats.shape, n_regions, dtype=np.intp)
+    np.minimum.at(idx, pt_idx, reg_idx)
+    idx[idx == n_regions] = -1
+    return idx
+
+
 def get_model_for_coordinate(lat: float, lon: float):
     """
     Return model name (e.g. 'Marmara', 'Coastal Aegean', 'Aegean', 'East')
@@ -238,17 +524,44 @@ def get_model_for_coordinate(lat: float, lon: float):
     return region["model"]
 
 
+def get_models_for_coordinates(lats, lons):
+    """
+    Return a list of model names for many coordinates, with None for
+    points outside all regions.
+    """
+    regions = _get_regions()
+    return [
+        regions[k]["model"] if k >= 0 else None
+        for k in find_regions_for_points(lats, lons)
+    ]
+
+
 # ============================================================
 #  LOAD COEFFICIENTS & SITE AMPLIFICATION FORMULAS
 # ============================================================
 
+# ln(Amp) as a numexpr expression (same terms as the NumPy path below):
+# lnVs = ln(Vs30/Vref), clipped to [ln(V1/Vref), ln(Vc/Vref)] for V*.
+_NE_LN_AMP = (
+    "c1_r * where(lnVs < logV1, logV1, where(lnVs > logVc, logVc, lnVs))"
+    " + c2 * (exp(c3 * (Vs_min - 360.0)) - c3_exp400)"
+    " * log((PSAr + c4) / c4)"
+)
+
+# numexpr only pays off when it can split a large array across threads;
+# single-threaded, NumPy's vectorized exp/log are faster.
+_NE_MIN_SIZE = 100_000
+
+
 def compute_site_amplification(Vs30, PSAr_list, model: str, periods,
-                               V1: float = 150.0, Vc: float = 800.0):
+                               V1: float = 150.0, Vc: float = 800.0,
+                               return_log: bool = False):
     """
     Compute site amplification using the final Icen (2025) model,
     allowing PSAr to be period-dependent.
 
         c1,r = c1 + Δc1,r
+        V* = clip(Vs30, V1, Vc)   (V1 below V1, Vc above Vc)
         f_linear = c1,r * ln(V*/Vref)
         f_nonlinear = c2 [exp(c3(min(Vs30,760)-360)) - exp(c3*400)]
                       * ln((PSAr(T) + c4)/c4)
@@ -259,32 +572,44 @@ def compute_site_amplification(Vs30, PSAr_list, model: str, periods,
     ----------
     Vs30 : float or array-like
         Time-averaged shear-wave velocity in top 30 m.
-    PSAr_list : list or array-like
-        Rock/reference PSA values for EACH period.
-        Must have same length as 'periods'.
+    PSAr_list : array-like, shape (n_periods,) or (n_periods, n_Vs30)
+        Rock/reference PSA values for EACH period. A 1-D array is shared
+        by all sites; a 2-D array gives a separate PSAr(T) for each site
+        (column j belongs to Vs30[j]).
     model : str
         One of 'Marmara', 'Coastal Aegean', 'Aegean', 'East'.
     periods : list or array-like
         Periods (s) for which coefficients are needed.
     V1, Vc : float
-        Defaults; per-period values in the file override these.
+        Ignored; the per-period V1 and VC columns of Icen_coeffs.txt are
+        always used. Kept so existing calls passing them still work.
+    return_log : bool
+        If True, return ln(Amp) and skip the final exp.
 
     Returns
     -------
     amps : ndarray, shape (n_periods, n_Vs30)
+        Amp, or ln(Amp) if return_log is True.
     """
-    Vs30 = np.array(Vs30, ndmin=1)
-    Vref = 760.0
+    Vs30 = np.array(Vs30, dtype=float, ndmin=1)
     periods = list(periods)
     PSAr_arr = np.array(PSAr_list, dtype=float)
 
+    if PSAr_arr.ndim not in (1, 2):
+        raise ValueError(
+            f"PSAr_list must be 1-D (n_periods,) or 2-D (n_periods, n_Vs30); "
+            f"got an array with shape {PSAr_arr.shape}."
+        )
     if len(PSAr_arr) != len(periods):
         raise ValueError(
             f"Length of PSAr_list ({len(PSAr_arr)}) must match "
             f"length of periods ({len(periods)})."
         )
-
-    results = []
+    if PSAr_arr.ndim == 2 and PSAr_arr.shape[1] != Vs30.size:
+        raise ValueError(
+            f"PSAr_list has shape {PSAr_arr.shape}; expected "
+            f"({len(periods)}, {Vs30.size}) to match Vs30."
+        )
 
     # Choose which Δc1 column to use for each model
     dcol_map = {
@@ -300,44 +625,59 @@ def compute_site_amplification(Vs30, PSAr_list, model: str, periods,
         )
     dcol = dcol_map[model]
 
-    coeff_list = load_coefficients_interpolated(model, periods)
-
-    # Loop over periods and corresponding PSAr
-    for i, (coeffs, PSAr_T) in enumerate(zip(coeff_list, PSAr_arr)):
-        # Per-period hinge velocities and nonlinear parameters
-        V1_p = float(coeffs.get("V1", V1))
-        Vc_p = float(coeffs.get("Vc", Vc))
-        c1 = float(coeffs["c1"])
-        d_c1 = float(coeffs[dcol])
-        c1_r = c1 + d_c1
-
-        c2 = float(coeffs["c2"])
-        c3 = float(coeffs["c3"])
-        c4 = float(coeffs["c4"])
-
-        if c4 <= 0:
-            raise ValueError(f"c4 must be > 0, got c4={c4}")
-
-        # ---------- f_linear ----------
-        VN = np.where(
-            Vs30 < V1_p,
-            np.log(V1_p / Vref),
-            np.where(
-                Vs30 <= Vc_p,
-                np.log(Vs30 / Vref),
-                np.log(Vc_p / Vref),
-            ),
-        )
-        f_linear = c1_r * VN
-
-        # ---------- f_nonlinear ----------
-        Vs_min = np.minimum(Vs30, 760.0)
-        nonlinear_shape = np.exp(c3 * (Vs_min - 360.0)) - np.exp(c3 * 400.0)
-        f_nonlinear = c2 * nonlinear_shape * np.log((PSAr_T + c4) / c4)
-
-        ln_amp = f_linear + f_nonlinear
-        Amp = np.exp(ln_amp)
-
-        results.append(Amp)
-
-    return np.array(results)  # (n_periods, n_Vs30)
+    coeffs = load_coefficients_interpolated(model, periods)
+    n_periods = len(periods)
+
+    # Per-period coefficients as column vectors (n_periods, 1) so that
+    # they broadcast against the site row vector (1, n_Vs30).
+    logV1 = coeffs["logV1_Vref"][:, None]
+    logVc = coeffs["logVc_Vref"][:, None]
+    c1_r = (coeffs["c1"] + coeffs[dcol])[:, None]
+
+    c2 = coeffs["c2"][:, None]
+    c3 = coeffs["c3"][:, None]
+    c3_exp400 = coeffs["c3_exp400"][:, None]
+    c4 = coeffs["c4"][:, None]
+
+    if np.any(c4 <= 0):
+        raise ValueError(f"c4 must be > 0, got c4={c4.ravel()}")
+
+    Vs = Vs30[None, :]
+    PSAr = PSAr_arr[:, None] if PSAr_arr.ndim == 1 else PSAr_arr
+
+    # Per-site terms, shape (1, n_Vs30)
+    lnVs = np.log(Vs / VREF)
+    Vs_min = np.minimum(Vs, 760.0)
+
+    n_out = n_periods * Vs30.size
+    if ne is not None and n_out >= _NE_MIN_SIZE and ne.get_num_threads() > 1:
+        expr = _NE_LN_AMP if return_log else f"exp({_NE_LN_AMP})"
+        return ne.evaluate(expr, local_dict={
+            "c1_r": c1_r, "lnVs": lnVs, "logV1": logV1, "logVc": logVc,
+            "c2": c2, "c3": c3, "c3_exp400": c3_exp400, "c4": c4,
+            "Vs_min": Vs_min, "PSAr": PSAr,
+        })
+
+    # Output allocated once, C-order (n_periods, n_Vs30); the terms below
+    # are accumulated into it in place instead of one temporary per op.
+    ln_amp = np.empty((n_periods, Vs30.size))
+
+    # ---------- f_nonlinear ----------
+    np.multiply(c3, Vs_min - 360.0, out=ln_amp)
+    np.exp(ln_amp, out=ln_amp)
+    ln_amp -= c3_exp400
+    ln_amp *= c2
+    ln_amp *= np.log((PSAr + c4) / c4)
+
+    # ---------- f_linear ----------
+    # V* = V1 below V1, Vc above Vc, Vs30 in between. log is monotonic,
+    # so clipping ln(Vs30/Vref) to the precomputed ln(V1/Vref), ln(Vc/Vref)
+    # is the same as ln(clip(Vs30, V1, Vc)/Vref), with one log per site
+    # instead of one per site and period.
+    VN = np.clip(lnVs, logV1, logVc)
+    VN *= c1_r
+    ln_amp += VN
+
+    if not return_log:
+        np.exp(ln_amp, out=ln_amp)
+    return ln_amp  # (n_periods, n_Vs30)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Numba point-in-polygon kernel for batch region lookup.
+
+Used by Icen2026.find_regions_for_points when numba is installed; without
+numba, NUMBA_AVAILABLE is False and the STRtree path is used instead.
+
+Region polygons are flattened into a CSR-style layout:
+
+    poly_xs, poly_ys : all ring vertices of all regions, each (closed) ring
+                       followed by a NaN separator
+    starts, ends     : vertex range [starts[r], ends[r]) of region r
+    bbox             : (n_regions, 4) array of (minx, miny, maxx, maxy)
+
+Containment uses the crossing-number (even-odd) test, so holes and
+multipolygon parts are handled by simply including all of their rings.
+
+Boundary points count as inside in find_region_for_point, and that
+decision relies on GEOS' robust orientation test, which plain floating
+point cannot reproduce. Points within NEAR_EDGE_TOL (degrees) of an edge
+are therefore reported as AMBIGUOUS so the caller can resolve them with
+shapely; all other points are classified exactly.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+AMBIGUOUS = -2
+NEAR_EDGE_TOL = 1e-9
+
+
+def flatten_polygons(polygons):
+    """
+    Flatten shapely (Multi)Polygons into the CSR arrays used by pip_batch.
+
+    Returns
+    -------
+    poly_xs, poly_ys : ndarray of float
+    starts, ends : ndarray of int
+    bbox : ndarray, shape (n_regions, 4)
+    """
+    xs_parts, ys_parts = [], []
+    starts, ends = [], []
+    pos = 0
+    for poly in polygons:
+        starts.append(pos)
+        for part in getattr(poly, "geoms", [poly]):
+            for ring in [part.exterior, *part.interiors]:
+                xy = np.asarray(ring.coords, dtype=float)
+                xs_parts.append(np.append(xy[:, 0], np.nan))
+                ys_parts.append(np.append(xy[:, 1], np.nan))
+                pos += len(xy) + 1
+        ends.append(pos)
+
+    poly_xs = np.concatenate(xs_parts)
+    poly_ys = np.concatenate(ys_parts)
+    bbox = np.array([poly.bounds for poly in polygons], dtype=float)
+    return (poly_xs, poly_ys,
+            np.array(starts, dtype=np.intp), np.array(ends, dtype=np.intp),
+            bbox)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def pip_batch(xs, ys, poly_xs, poly_ys, starts, ends, bbox):
+        """
+        Return the index of the first region containing each point,
+        -1 if none does, or AMBIGUOUS if the point is within NEAR_EDGE_TOL
+        of an edge of a region it was tested against.
+        """
+        n = xs.size
+        out = np.full(n, -1, dtype=np.intp)
+
+        for i in prange(n):
+            x = xs[i]
+            y = ys[i]
+            for r in range(starts.size):
+                # bounding-box rejection (also rejects NaN coordinates)
+                if not (bbox[r, 0] <= x <= bbox[r, 2]
+                        and bbox[r, 1] <= y <= bbox[r, 3]):
+                    continue
+
+                inside = False
+                near_edge = False
+                for k in range(starts[r], ends[r] - 1):
+                    x0 = poly_xs[k]
+                    y0 = poly_ys[k]
+                    x1 = poly_xs[k + 1]
+                    y1 = poly_ys[k + 1]
+                    if np.isnan(x0) or np.isnan(x1):
+                        continue  # ring separator
+
+                    # (nearly) on the edge -> leave it to shapely
+                    det = (x1 - x0) * (y - y0) - (y1 - y0) * (x - x0)
+                    if (min(y0, y1) <= y <= max(y0, y1)
+                            and abs(det) <= NEAR_EDGE_TOL
+                            * (abs(x1 - x0) + abs(y1 - y0))):
+                        near_edge = True
+                        break
+
+                    # edge straddles the horizontal ray through the point
+                    if (y0 > y) != (y1 > y):
+                        x_cross = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                        if x < x_cross:
+                            inside = not inside
+
+                if near_edge:
+                    out[i] = AMBIGUOUS
+                    break
+                if inside:
+                    out[i] = r
+                    break
+
+        return out
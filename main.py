@@ -12,6 +12,7 @@ Uses:
 
 Writes:
     - Output.xlsx  : same input columns + amplification for each period
+    - Output.parquet : same table, if a parquet engine (pyarrow) is installed
 
 Folder structure (example):
 
@@ -28,10 +29,21 @@ Folder structure (example):
 """
 
 import os
+import datetime
 import numpy as np
 import pandas as pd
 
-from Icen2026 import get_model_for_coordinate, compute_site_amplification
+# Stream Output.xlsx row by row when xlsxwriter is installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+from Icen2026 import (
+    EXCEL_ENGINE,
+    get_models_for_coordinates,
+    compute_site_amplification,
+)
 
 
 # ============================================================
@@ -47,6 +59,7 @@ PERIODS_FILE = os.path.join(BASE_DIR, "Periods.txt")
 PSAR_FILE    = os.path.join(BASE_DIR, "PSAr.txt")
 INPUT_FILE   = os.path.join(BASE_DIR, "Input.xlsx")
 OUTPUT_FILE  = os.path.join(BASE_DIR, "Output.xlsx")
+OUTPUT_PARQUET = os.path.splitext(OUTPUT_FILE)[0] + ".parquet"
 
 
 # ============================================================
@@ -77,6 +90,59 @@ def load_psar(path):
     return psar_vals
 
 
+# ============================================================
+#  WRITERS
+# ============================================================
+
+def save_output(df, xlsx_path, parquet_path=None):
+    """
+    Write df to xlsx_path and, optionally, to a parquet sidecar.
+
+    With xlsxwriter installed the workbook is written in constant-memory
+    mode, one row at a time (pandas' to_excel writes column by column,
+    which constant-memory mode cannot handle), with a bold bordered header
+    and dates/datetimes in the same number formats to_excel uses.
+    Otherwise pandas' default writer is used. NaN/NaT values are left as
+    empty cells; ±inf, which xlsx cannot store, becomes a #NUM! error.
+
+    The parquet file is optional: it is skipped with a warning if no
+    parquet engine is installed or the table cannot be stored as parquet
+    (e.g. a Station column mixing numbers and text, or repeated periods).
+    Its column names are converted to str, as parquet requires.
+    """
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(
+            xlsx_path, {"constant_memory": True, "nan_inf_to_errors": True}
+        )
+        header_fmt = workbook.add_format(
+            {"bold": True, "border": 1, "align": "center", "valign": "top"}
+        )
+        datetime_fmt = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+        date_fmt = workbook.add_format({"num_format": "yyyy-mm-dd"})
+
+        sheet = workbook.add_worksheet("Sheet1")
+        sheet.write_row(0, 0, list(df.columns), header_fmt)
+        for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            for c, v in enumerate(row):
+                if pd.isna(v):
+                    continue  # empty cell
+                if isinstance(v, datetime.datetime):
+                    sheet.write_datetime(r, c, v, datetime_fmt)
+                elif isinstance(v, datetime.date):
+                    sheet.write_datetime(r, c, v, date_fmt)
+                else:
+                    sheet.write(r, c, v)
+        workbook.close()
+    else:
+        df.to_excel(xlsx_path, index=False)
+
+    if parquet_path is not None:
+        try:
+            df.rename(columns=str).to_parquet(parquet_path, index=False)
+        except (ImportError, ValueError) as exc:
+            print(f"[WARN] {parquet_path} not written: {exc}")
+
+
 # ============================================================
 #  MAIN WORKFLOW
 # ============================================================
@@ -93,7 +159,7 @@ def main():
         )
 
     # 2) Load input sites
-    df_in = pd.read_excel(INPUT_FILE)
+    df_in = pd.read_excel(INPUT_FILE, engine=EXCEL_ENGINE)
 
     # Expected columns in Input.xlsx
     required_cols = ["Station", "Vs30", "Latitude", "Longitude"]
@@ -104,55 +170,54 @@ def main():
             f"Found columns: {list(df_in.columns)}"
         )
 
-    # 3) Loop over sites and compute amplification
-    amp_rows = []   # list of [amp(T1), amp(T2), ...] for each row
-    model_list = [] # optional: keep track of which model was used per site
-
-    for idx, row in df_in.iterrows():
-        station = row["Station"]
-        vs30    = float(row["Vs30"])
-        lat     = float(row["Latitude"])
-        lon     = float(row["Longitude"])
-
-        # Determine model based on coordinate
-        model_name = get_model_for_coordinate(lat, lon)
-        model_list.append(model_name)
+    # 3) Determine model for every site in one batch lookup
+    stations = df_in["Station"].to_numpy()
+    vs30     = df_in["Vs30"].to_numpy(dtype=float)
+    lat      = df_in["Latitude"].to_numpy(dtype=float)
+    lon      = df_in["Longitude"].to_numpy(dtype=float)
+
+    model_list = get_models_for_coordinates(lat, lon)
+    models = np.array(model_list, dtype=object)
+
+    # 4) Compute amplification once per model for all of its sites
+    #    Sites outside all regions keep NaN.
+    #    One row per station, so each model's result fills whole rows.
+    amp = np.full((len(df_in), len(periods)), np.nan)
+
+    for model_name in dict.fromkeys(m for m in model_list if m is not None):
+        mask = models == model_name
+        # Vs30 is a vector -> result shape (n_periods, n_sites_in_model)
+        amps = compute_site_amplification(
+            Vs30=vs30[mask],
+            PSAr_list=psar_list,
+            model=model_name,
+            periods=periods,
+        )
+        amp[mask] = amps.T
 
+    for station, model_name, v, la, lo in zip(stations, model_list, vs30, lat, lon):
         if model_name is None:
             print(
                 f"[WARN] Station {station}: "
-                f"(lat={lat}, lon={lon}) outside all regions. "
+                f"(lat={la}, lon={lo}) outside all regions. "
                 "Amplification set to NaN."
             )
-            amp_vals = [np.nan] * len(periods)
         else:
-            # Compute site amplification for this site
-            # Vs30 is scalar -> result shape (n_periods, 1)
-            amps = compute_site_amplification(
-                Vs30=vs30,
-                PSAr_list=psar_list,
-                model=model_name,
-                periods=periods,
-            )
-            amp_vals = amps[:, 0].tolist()
-
             print(
                 f"Station {station}: model={model_name}, "
-                f"Vs30={vs30}"
+                f"Vs30={v}"
             )
 
-        amp_rows.append(amp_vals)
-
-    # 4) Build amplification DataFrame with period columns
-    amp_df = pd.DataFrame(amp_rows, columns=periods)
+    # 5) Build amplification DataFrame with period columns
+    amp_df = pd.DataFrame(amp, columns=periods, index=df_in.index)
 
-    # 5) Combine input columns + amplification columns
+    # 6) Combine input columns + amplification columns
     #    If you also want the model name in output, uncomment the line below.
     # df_out = pd.concat([df_in, pd.Series(model_list, name="Model"), amp_df], axis=1)
     df_out = pd.concat([df_in, amp_df], axis=1)
 
-    # 6) Save to Output.xlsx
-    df_out.to_excel(OUTPUT_FILE, index=False)
+    # 7) Save to Output.xlsx (+ Output.parquet)
+    save_output(df_out, OUTPUT_FILE, OUTPUT_PARQUET)
     print(f"\nSaved results to:\n  {OUTPUT_FILE}")
 
 
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Region lookup consistency checks: the numba kernel and the scalar lookup
+must agree with the STRtree query, including points on region boundaries.
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Icen2026  # noqa: E402
+
+
+def _boundary_and_random_points():
+    """Vertices, edge midpoints and near-edge offsets of every region, plus
+    random points over Türkiye and a NaN coordinate."""
+    rng = np.random.default_rng(0)
+    pts = []
+    for region in Icen2026.REGIONS:
+        poly = region["polygon"]
+        for part in getattr(poly, "geoms", [poly]):
+            for ring in [part.exterior, *part.interiors]:
+                xy = np.asarray(ring.coords)
+                mid = (xy[1:] + xy[:-1]) / 2
+                pts += [xy, mid, mid + 1e-7, mid - 1e-7]
+    xy = np.vstack(pts + [
+        np.column_stack([rng.uniform(25, 46, 5000), rng.uniform(34, 43.5, 5000)]),
+        [[30.0, np.nan], [np.nan, 38.0]],
+    ])
+    return xy[:, 1], xy[:, 0]  # lats, lons
+
+
+def test_pip_batch_matches_strtree():
+    kernel = Icen2026._get_pip_numba()
+    if kernel is None:
+        pytest.skip("numba not installed")
+
+    lats, lons = _boundary_and_random_points()
+    idx = kernel.pip_batch(lons, lats, *Icen2026._get_pip_arrays())
+    amb = idx == kernel.AMBIGUOUS
+    idx[amb] = Icen2026._query_tree(lats[amb], lons[amb])
+
+    np.testing.assert_array_equal(idx, Icen2026._query_tree(lats, lons))
+
+
+def test_find_regions_for_points_numba_path(monkeypatch):
+    if Icen2026._get_pip_numba() is None:
+        pytest.skip("numba not installed")
+
+    lats, lons = _boundary_and_random_points()
+    expected = Icen2026._query_tree(lats, lons)
+    monkeypatch.setattr(Icen2026, "_NUMBA_MIN_POINTS", 0)
+
+    np.testing.assert_array_equal(
+        Icen2026.find_regions_for_points(lats, lons), expected
+    )
+
+
+def test_find_region_for_point_matches_strtree():
+    lats, lons = _boundary_and_random_points()
+    expected = Icen2026._query_tree(lats, lons)
+    index_of = {id(r): k for k, r in enumerate(Icen2026.REGIONS)}
+    got = [
+        index_of[id(r)] if r is not None else -1
+        for r in (Icen2026.find_region_for_point(lat, lon)
+                  for lat, lon in zip(lats, lons))
+    ]
+
+    assert got == expected.tolist()
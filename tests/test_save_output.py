@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+main.save_output must produce the same workbook contents as df.to_excel.
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def test_save_output_matches_to_excel(tmp_path):
+    if main.xlsxwriter is None:
+        pytest.skip("xlsxwriter not installed")
+    openpyxl = pytest.importorskip("openpyxl")
+
+    df = pd.DataFrame({
+        "Station": [1, "ANK01", 3],
+        "Date": pd.to_datetime(["2020-01-01 00:00", "2021-05-06 12:30", None]),
+        "Vs30": [200.0, np.nan, 760.0],
+        0.1: [1.25, np.inf, -np.inf],
+    })
+
+    ours = tmp_path / "ours.xlsx"
+    ref = tmp_path / "ref.xlsx"
+    main.save_output(df, str(ours))
+    df.to_excel(ref, index=False, engine="openpyxl")
+
+    got = pd.read_excel(ours, engine="openpyxl")
+    expected = pd.read_excel(ref, engine="openpyxl")
+    # xlsx has no infinity: save_output stores ±inf as a #NUM! error cell,
+    # which reads back as NaN
+    expected = expected.replace([np.inf, -np.inf], np.nan)
+    pd.testing.assert_frame_equal(got, expected)
+
+    sheet = openpyxl.load_workbook(ours).active
+    assert sheet["A1"].font.b
+    assert sheet["B2"].number_format == "yyyy-mm-dd hh:mm:ss"
+    assert sheet["B2"].is_date
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+Reference values for compute_site_amplification.
+
+The expected amplifications were produced by the original per-period
+implementation; they pin the model output across refactorings.
+
+Run from the repository root:
+
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Icen2026  # noqa: E402
+
+# 0.1 and 1.0 s are tabulated, 0.33 s is interpolated between 0.3 and 0.4
+PERIODS = [0.1, 0.33, 1.0]
+PSAR = [0.3, 0.2, 0.05]
+# below V1, at V1 (150), between, at 760, at Vc (800), above Vc
+VS30 = [100.0, 150.0, 300.0, 760.0, 800.0, 1200.0]
+
+AMP_MARMARA = np.array([
+    [0.8093687367379101, 1.0861141691349625, 1.2255132253515009,
+     1.0, 0.9739839726847568, 0.9739839726847568],
+    [0.9748922140723124, 1.2452463881320377, 1.2958929925873388,
+     1.0, 0.9751187693579716, 0.9751187693579716],
+    [2.0717249577683146, 2.4255970986559605, 1.8131884082982874,
+     1.0, 0.9639227684334475, 0.9639227684334475],
+])
+
+AMP_EAST = np.array([
+    [0.713328041227165, 0.9572345182749431, 1.1399707485200994,
+     1.0, 0.9778806527378106, 0.9778806527378106],
+    [0.809537126038919, 1.034035524858526, 1.1650100863428172,
+     1.0, 0.9808646516938668, 0.9808646516938668],
+    [1.66717024901342, 1.9519402437129507, 1.6010111557232458,
+     1.0, 0.9705652243106107, 0.9705652243106107],
+])
+
+# PSAr_list given per site: column j is PSAr(T) for VS30_2D[j]
+VS30_2D = [150.0, 400.0, 800.0]
+PSAR_2D = np.array([
+    [0.05, 0.3, 0.8],
+    [0.02, 0.2, 0.5],
+    [0.01, 0.05, 0.2],
+])
+AMP_AEGEAN_2D = np.array([
+    [1.9051489383018265, 1.2080303574323914, 0.9743413613447025],
+    [2.159653397823732, 1.2749070534966376, 0.9734338349923966],
+    [3.4628786072435287, 1.633460534850308, 0.9593880272142504],
+])
+
+
+def test_reference_values():
+    for model, expected in [("Marmara", AMP_MARMARA), ("East", AMP_EAST)]:
+        amp = Icen2026.compute_site_amplification(VS30, PSAR, model, PERIODS)
+        assert amp.shape == (len(PERIODS), len(VS30))
+        np.testing.assert_allclose(amp, expected, rtol=1e-12)
+
+
+def test_per_site_psar():
+    amp = Icen2026.compute_site_amplification(
+        VS30_2D, PSAR_2D, "Aegean", PERIODS
+    )
+    np.testing.assert_allclose(amp, AMP_AEGEAN_2D, rtol=1e-12)
+
+
+def test_return_log():
+    ln_amp = Icen2026.compute_site_amplification(
+        VS30, PSAR, "Marmara", PERIODS, return_log=True
+    )
+    np.testing.assert_allclose(ln_amp, np.log(AMP_MARMARA), rtol=1e-12, atol=1e-15)
+
+    ln_amp = Icen2026.compute_site_amplification(
+        VS30_2D, PSAR_2D, "Aegean", PERIODS, return_log=True
+    )
+    np.testing.assert_allclose(ln_amp, np.log(AMP_AEGEAN_2D), rtol=1e-12, atol=1e-15)
+
+
+def test_scalar_vs30():
+    amp = Icen2026.compute_site_amplification(300.0, PSAR, "Marmara", PERIODS)
+    np.testing.assert_allclose(amp, AMP_MARMARA[:, [2]], rtol=1e-12)
+
+
+@pytest.mark.parametrize("return_log", [False, True])
+@pytest.mark.parametrize("per_site_psar", [False, True])
+def test_numexpr_matches_numpy(monkeypatch, return_log, per_site_psar):
+    ne = Icen2026.ne
+    if ne is None:
+        pytest.skip("numexpr not installed")
+
+    rng = np.random.default_rng(0)
+    periods = [-1, 0, 0.01, 0.015, 0.33, 1.0, 2.7, 10]
+    vs30 = np.concatenate([rng.uniform(50, 2000, 200), VS30])
+    if per_site_psar:
+        psar = rng.uniform(0.001, 2, (len(periods), vs30.size))
+    else:
+        psar = rng.uniform(0.001, 2, len(periods))
+
+    # force the numexpr branch
+    monkeypatch.setattr(Icen2026, "_NE_MIN_SIZE", 0)
+    n_threads = ne.set_num_threads(2)
+    try:
+        fused = Icen2026.compute_site_amplification(
+            vs30, psar, "Coastal Aegean", periods, return_log=return_log
+        )
+    finally:
+        ne.set_num_threads(n_threads)
+
+    monkeypatch.setattr(Icen2026, "ne", None)
+    plain = Icen2026.compute_site_amplification(
+        vs30, psar, "Coastal Aegean", periods, return_log=return_log
+    )
+
+    np.testing.assert_allclose(fused, plain, rtol=1e-13, atol=1e-15)